@@ -1,19 +1,13 @@
-import os
-from pprint import pprint
-import shutil
-import subprocess
-import urllib.request
-import pkg_resources
-
 import h5py
-import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.cm
-from matplotlib.patches import Rectangle
-matplotlib.pyplot.show()
 
 import openmc.data
 
+# Photon data is read straight from the EPICS2017 ENDF files that
+# PhotonKerma.py converts, which avoids a round trip through an intermediate
+# HDF5 file
+from PhotonKerma import EPDL_PATH, EADL_PATH
+
 
 print(" ");
 print ("OpenMC version:  ",openmc.__version__);
@@ -21,8 +15,11 @@ print ("H5PY   version:  ",h5py.__version__);
 print(" ");
 
 
-# Load Neutron H5 data into object
-h1 = openmc.data.IncidentNeutron.from_hdf5('/home/pyoung/Nuclear_Data/OpenMC/endfb80_hdf5/H1.h5')
+# Load Neutron H5 data into object; open the file with a large chunk cache so
+# chunked datasets are not re-read from disk
+with h5py.File('/home/pyoung/Nuclear_Data/OpenMC/endfb80_hdf5/H1.h5', 'r',
+               rdcc_nbytes=64<<20, rdcc_nslots=521) as f:
+    h1 = openmc.data.IncidentNeutron.from_hdf5(f['H1'])
 print(h1);
 print(list(h1.reactions.values())[:10]);
 # print(h1.energy);
@@ -42,55 +39,55 @@ heating_xs = heating.xs['294K'](energies)
 
 
 
-# Load Photon H5 data into object
-h1ENDFepics2017 = openmc.data.IncidentPhoton.from_hdf5('/home/pyoung/Nuclear_Data/OpenMC/Photon_testing/EPICS2017/H5-OMC13/H.OMC13-kerma.test.h5')
-
-
-
-print(h1ENDFepics2017);
-print(list(h1ENDFepics2017.reactions.values())[:10]);
-print(list(h1ENDFepics2017.bremsstrahlung)[:10]);
-print(list(h1ENDFepics2017.bremsstrahlung.values())[:10]);
-print(list(h1ENDFepics2017.compton_profiles)[:10]);
-print(list(h1ENDFepics2017.compton_profiles.values())[:10]);
-
-
 
 
+def plot_element(Z, energies):
+    """Load photon data for an element from ENDF and plot its cross sections."""
+    # Load Photon ENDF data into object
+    X = openmc.data.IncidentPhoton.from_endf(EPDL_PATH.format(Z=Z),
+                                             EADL_PATH.format(Z=Z))
 
-heating17 = h1ENDFepics2017[525]
-print(heating17.xs);
-print(heating17.xs([1000000,2000000,3000000,4000000,5000000]));
+    print(X);
+    print(list(X.reactions.values())[:10]);
+    print(list(X.bremsstrahlung)[:10]);
+    print(list(X.bremsstrahlung.values())[:10]);
+    print(list(X.compton_profiles)[:10]);
+    print(list(X.compton_profiles.values())[:10]);
 
-heating17_xs = heating17.xs(energies);
 
+    heating17 = X[525]
+    print(heating17.xs);
+    print(heating17.xs([1000000,2000000,3000000,4000000,5000000]));
 
-# Plot EPICS2017(fromENDF)  mt 525
-# energies = h1.energy['294K']
-plt.loglog(energies, heating17_xs)
-plt.xlabel('Energy (eV)')
-plt.ylabel('Heating XS (eV.barn)')
-plt.xlim(1,    100000000000) 
-plt.ylim(0.1, 1000000000000) 
-plt.show(block=True)
+    heating17_xs = heating17.xs(energies);
 
+    total17 = X[501]
+    print(total17.xs);
+    print(total17.xs([1000000,2000000,3000000,4000000,5000000]));
 
+    total17_xs = total17.xs(energies);
 
 
-# Plot EPICS2017  mt 501
-total17 = h1ENDFepics2017[501]
-print(total17.xs);
-print(total17.xs([1000000,2000000,3000000,4000000,5000000]));
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
 
-total17_xs = total17.xs(energies);
+    # Plot EPICS2017(fromENDF)  mt 525
+    ax1.loglog(energies, heating17_xs)
+    ax1.set_xlabel('Energy (eV)')
+    ax1.set_ylabel('Heating XS (eV.barn)')
+    ax1.set_xlim(1,    100000000000)
+    ax1.set_ylim(0.1, 1000000000000)
 
+    # Plot EPICS2017  mt 501
+    ax2.loglog(energies, total17_xs)
+    ax2.set_xlabel('Energy (eV)')
+    ax2.set_ylabel('Total Photon Interaction XS (Barns)')
+    ax2.set_xlim(1000,    100000000000)
+    ax2.set_ylim(0.01, 100)
 
-plt.loglog(energies, total17_xs)
-plt.xlabel('Energy (eV)')
-plt.ylabel('Total Photon Interaction XS (Barns)')
-plt.xlim(1000,    100000000000) 
-plt.ylim(0.01, 100) 
-plt.show(block=True)
+    fig.tight_layout()
+    plt.show()
 
+    return X
 
 
+plot_element('H', energies)
@@ -1,57 +1,77 @@
 import os;
-from pprint import pprint;
-import shutil;
-import subprocess;
-import urllib.request;
-import numpy  as np
-import pandas as pd
-import pkg_resources
+from concurrent.futures import ProcessPoolExecutor;
 
 import h5py;
-import numpy as np;
-import matplotlib.pyplot as plt;
-import matplotlib.cm;
-from matplotlib.patches import Rectangle;
 
 import openmc;
+from openmc.data import PERIODIC_TABLE;
 
 
-print(" ")
-print("_________________________________________")
-print ("BEGIN OpenMC Processing of Photon Nuclear Data");
-print("_________________________________________")
-print(" ");
-print ("OpenMC version:  ",openmc.__version__);
-print ("H5PY   version:  ",h5py.__version__);
-print(" ");
-print ("Photon TLE Kerma Data included");
-print ("Nuclear Data is EPIC-2017, with Red Cullen minor modifications in July 2018");
-print ("https://www-nds.iaea.org/epics/");
+EPDL_PATH = "./EPICS2017/ENDF/EPDL/{Z}.epdl.endf"
+EADL_PATH = "./EPICS2017/ENDF/EADL/{Z}.eadl.endf"
+H5_PATH = "./EPICS2017/H5/photon_data.OMC-0.11.1-kerma.h5"
 
-print(" ");
-print(" ");
-print(" ");
 
-for Z in ['H', 'He', 'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne', 'Na', 'Mg', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar', 'K', 'Ca', 'Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn', 'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr', 'Rb', 'Sr', 'Y', 'Zr', 'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd', 'In', 'Sn', 'Sb', 'Te', 'I', 'Xe', 'Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg', 'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn', 'Fr', 'Ra', 'Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm']:
-# Load ENDF Nuclear Data into object
-       print ("Import Photon ENDF data; PhotoAtomic Data and AtomicRelaxation Data for element:  ",Z);
-       s1=f"./EPICS2017/ENDF/EPDL/{Z}.epdl.endf";
-       s2=f"./EPICS2017/ENDF/EADL/{Z}.eadl.endf";
-       s3=f"./EPICS2017/H5/{Z}.OMC-0.11.1-kerma.h5";
-       X = openmc.data.IncidentPhoton.from_endf(s1,s2);
+def process_element(Z, epdl_path=EPDL_PATH, eadl_path=EADL_PATH):
+    """Read ENDF photoatomic/atomic relaxation data for one element.
 
-# Create H5 Nuclear Data
-       print ("Producing .h5  of element:  ",Z);
-       X.export_to_hdf5(s3);
-       print(" ");
+    Elements are independent, so this is run in separate worker processes;
+    the resulting objects are written to a single HDF5 file by the parent.
 
+    """
+    # Load ENDF Nuclear Data into object
+    print ("Import Photon ENDF data; PhotoAtomic Data and AtomicRelaxation Data for element:  ",Z);
+    s1=epdl_path.format(Z=Z);
+    s2=eadl_path.format(Z=Z);
+    return openmc.data.IncidentPhoton.from_endf(s1,s2);
 
 
+if __name__ == '__main__':
+    print(" ")
+    print("_________________________________________")
+    print ("BEGIN OpenMC Processing of Photon Nuclear Data");
+    print("_________________________________________")
+    print(" ");
+    print ("OpenMC version:  ",openmc.__version__);
+    print ("H5PY   version:  ",h5py.__version__);
+    print(" ");
+    print ("Photon TLE Kerma Data included");
+    print ("Nuclear Data is EPIC-2017, with Red Cullen minor modifications in July 2018");
+    print ("https://www-nds.iaea.org/epics/");
 
-print(" ");
-print(" ");
-print(" ");
+    print(" ");
+    print(" ");
+    print(" ");
 
-print("_________________________________________")
-print ("END OpenMC Processing of Photon Nuclear Data");
-print("_________________________________________")
\ No newline at end of file
+    # Elements already in the output file are skipped, so re-running after an
+    # interruption only processes the ones that are missing
+    done = set()
+    h5_kwargs = {'libver': 'latest'}
+    if os.path.exists(H5_PATH):
+        with h5py.File(H5_PATH, 'r') as f:
+            done = set(f)
+    else:
+        # The file space strategy can only be set when the file is created
+        h5_kwargs.update(fs_strategy='page', fs_page_size=4*1024*1024)
+    remaining = [Z for Z in PERIODIC_TABLE if Z not in done]
+
+    # Elements are independent, so parse them concurrently and write them all
+    # to one HDF5 file as they come in. The workers are started before the
+    # output file is opened since HDF5 isn't safe to fork with a file open
+    # for writing.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = ex.map(process_element, remaining)
+        with h5py.File(H5_PATH, 'a', **h5_kwargs) as out:
+            for X in results:
+                # Create H5 Nuclear Data
+                print ("Producing .h5  of element:  ",X.name);
+                X.export_to_hdf5(out);
+                print(" ");
+
+    print(" ");
+    print(" ");
+    print(" ");
+
+    print("_________________________________________")
+    print ("END OpenMC Processing of Photon Nuclear Data");
+    print("_________________________________________")
@@ -1,8 +1,60 @@
 # cython: c_string_type=str, c_string_encoding=ascii
 
+from libc.string cimport memcpy, memset
+
+import numpy as np
+
 cdef extern from "endf.c":
-    double cfloat_endf(const char* buffer, int n)
+    double cfloat_endf(const char* buffer, int n) nogil
+
+# Number of characters in the data portion (fields 1-6) of an ENDF record
+cdef enum:
+    DATA_WIDTH = 66
+
 
 def float_endf(s):
     cdef const char* c_string = s
     return cfloat_endf(c_string, len(s))
+
+
+def float_endf_block(file_obj, Py_ssize_t n):
+    """Read floating point numbers stored six per record from an ENDF-6 file.
+
+    Parameters
+    ----------
+    file_obj : file-like object
+        ENDF-6 file to read from, positioned at the first record of the block
+    n : int
+        Number of values to read
+
+    Returns
+    -------
+    numpy.ndarray
+        The values
+
+    """
+    cdef Py_ssize_t n_lines = (n + 5) // 6 if n > 0 else 0
+    cdef Py_ssize_t i, length
+    cdef const char* c_line
+    cdef bytearray block = bytearray(n_lines * DATA_WIDTH)
+    cdef char* buffer = block
+    cdef double[::1] values = np.empty(n)
+
+    # Copy the data portion of each record into a fixed-width buffer, padding
+    # short lines with blanks (which are interpreted as zero)
+    memset(buffer, c' ', n_lines * DATA_WIDTH)
+    for i in range(n_lines):
+        line = file_obj.readline()
+        c_line = line
+        length = min(len(line), DATA_WIDTH)
+        if length > 0 and c_line[length - 1] == c'\n':
+            length -= 1
+        memcpy(buffer + i*DATA_WIDTH, c_line, length)
+
+    # Field i is in record i // 6 at column 11*(i % 6)
+    with nogil:
+        for i in range(n):
+            values[i] = cfloat_endf(
+                buffer + (i // 6)*DATA_WIDTH + 11*(i % 6), 11)
+
+    return np.asarray(values)
@@ -0,0 +1,84 @@
+from libc.math cimport exp, log
+
+cimport numpy as np
+cimport cython
+from cython.parallel cimport prange
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def tab1_eval(const double[::1] x, const double[::1] y,
+              const np.int64_t[::1] breakpoints,
+              const np.int64_t[::1] interpolation,
+              const double[::1] xin, double[::1] out):
+    """Evaluate a tabulated function at an array of points
+
+    This is a precompiled equivalent of :func:`openmc.data.function._tab1_eval`
+    that avoids the cost of just-in-time compilation. When the extension is
+    compiled with OpenMP, the loop over points is distributed across threads.
+    Points outside the tabulated range are assigned a value of zero.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Tabulated (x,y) pairs
+    breakpoints, interpolation : numpy.ndarray
+        Breakpoints and ENDF interpolation law for each interpolation region
+    xin : numpy.ndarray
+        Points at which to evaluate the function
+    out : numpy.ndarray
+        Array to write results to
+
+    """
+    cdef Py_ssize_t n = x.shape[0]
+    cdef Py_ssize_t n_regions = breakpoints.shape[0]
+    cdef Py_ssize_t i, idx, lo, hi, mid, k
+    cdef np.int64_t p
+    cdef double xi, x0, x1, y0, y1
+
+    for i in prange(xin.shape[0], nogil=True, schedule='static'):
+        xi = xin[i]
+        out[i] = 0.0
+        if not (x[0] <= xi < x[n - 1]):
+            continue
+
+        # Bisect to find idx such that x[idx] <= xi < x[idx + 1]
+        lo = 0
+        hi = n - 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if x[mid] <= xi:
+                lo = mid
+            else:
+                hi = mid
+        idx = lo
+
+        # Determine interpolation region. In-place operators on variables
+        # inside prange denote reductions, so k is incremented explicitly.
+        k = 0
+        while k < n_regions and idx >= breakpoints[k] - 1:
+            k = k + 1
+        if k == n_regions:
+            continue
+        p = interpolation[k]
+
+        x0 = x[idx]
+        x1 = x[idx + 1]
+        y0 = y[idx]
+        y1 = y[idx + 1]
+        if p == 1:
+            # Histogram
+            out[i] = y0
+        elif p == 2:
+            # Linear-linear
+            out[i] = y0 + (xi - x0)/(x1 - x0)*(y1 - y0)
+        elif p == 3:
+            # Linear-log
+            out[i] = y0 + log(xi/x0)/log(x1/x0)*(y1 - y0)
+        elif p == 4:
+            # Log-linear
+            out[i] = y0*exp((xi - x0)/(x1 - x0)*log(y1/y0))
+        elif p == 5:
+            # Log-log
+            out[i] = y0*exp(log(xi/x0)/log(x1/x0)*log(y1/y0))
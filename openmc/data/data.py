@@ -1,11 +1,13 @@
-import itertools
+from functools import lru_cache
 import json
-import os
 import re
 from pathlib import Path
 from math import sqrt, log
+import sys
 from warnings import warn
 
+import numpy as np
+
 # Isotopic abundances from M. Berglund and M. E. Wieser, "Isotopic compositions
 # of the elements 2009 (IUPAC Technical Report)", Pure. Appl. Chem. 83 (2),
 # pp. 397--410 (2011).
@@ -162,7 +164,18 @@ ATOMIC_SYMBOL = {0: 'n', 1: 'H', 2: 'He', 3: 'Li', 4: 'Be', 5: 'B', 6: 'C',
                  108: 'Hs', 109: 'Mt', 110: 'Ds', 111: 'Rg', 112: 'Cn',
                  113: 'Nh', 114: 'Fl', 115: 'Mc', 116: 'Lv', 117: 'Ts',
                  118: 'Og'}
-ATOMIC_NUMBER = {value: key for key, value in ATOMIC_SYMBOL.items()}
+
+# Intern the element and nuclide names so that dictionary lookups with these
+# same strings (e.g., in zam and isotopes) can short-circuit on identity
+NATURAL_ABUNDANCE = {sys.intern(k): v for k, v in NATURAL_ABUNDANCE.items()}
+ELEMENT_SYMBOL = {sys.intern(k): sys.intern(v)
+                  for k, v in ELEMENT_SYMBOL.items()}
+ATOMIC_SYMBOL = {k: sys.intern(v) for k, v in ATOMIC_SYMBOL.items()}
+ATOMIC_NUMBER = {v: k for k, v in ATOMIC_SYMBOL.items()}
+
+# Symbols of the elements H through Fm, which are covered by the EPICS
+# photoatomic and atomic relaxation evaluations
+PERIODIC_TABLE = tuple(ATOMIC_SYMBOL[z] for z in range(1, 101))
 
 # Values here are from the Committee on Data for Science and Technology
 # (CODATA) 2018 recommendation (https://physics.nist.gov/cuu/Constants/).
@@ -186,10 +199,42 @@ _ATOMIC_MASS = {}
 # Regex for GNDS nuclide names (used in zam function)
 _GNDS_NAME_RE = re.compile(r'([A-Zn][a-z]*)(\d+)((?:_[em]\d+)?)')
 
+# Naturally occurring isotopes grouped by element symbol (used in isotopes
+# function)
+_ISOTOPES_BY_ELEMENT = {}
+for _kv in NATURAL_ABUNDANCE.items():
+    _symbol = _GNDS_NAME_RE.match(_kv[0]).group(1)
+    _ISOTOPES_BY_ELEMENT.setdefault(_symbol, []).append(_kv)
+del _kv, _symbol
+
 # Used in half_life function as a cache
 _HALF_LIFE = {}
 _LOG_TWO = log(2.0)
 
+# IAPWS-IF97 region 1 coefficients (used in water_density function). The
+# products n_i*I_i and exponents I_i - 1 are precomputed since only the
+# derivative of the Gibbs free energy with respect to pressure is needed.
+_N1F = np.array([
+    0.14632971213167, -0.84548187169114, -0.37563603672040e1,
+    0.33855169168385e1, -0.95791963387872, 0.15772038513228,
+    -0.16616417199501e-1, 0.81214629983568e-3, 0.28319080123804e-3,
+    -0.60706301565874e-3, -0.18990068218419e-1, -0.32529748770505e-1,
+    -0.21841717175414e-1, -0.52838357969930e-4, -0.47184321073267e-3,
+    -0.30001780793026e-3, 0.47661393906987e-4, -0.44141845330846e-5,
+    -0.72694996297594e-15, -0.31679644845054e-4, -0.28270797985312e-5,
+    -0.85205128120103e-9, -0.22425281908000e-5, -0.65171222895601e-6,
+    -0.14341729937924e-12, -0.40516996860117e-6, -0.12734301741641e-8,
+    -0.17424871230634e-9, -0.68762131295531e-18, 0.14478307828521e-19,
+    0.26335781662795e-22, -0.11947622640071e-22, 0.18228094581404e-23,
+    -0.93537087292458e-25])
+_I1F = np.array([0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3,
+                 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32])
+_J1F = np.array([-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3,
+                 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31, -38, -39,
+                 -40, -41])
+_N_I1F = _N1F * _I1F
+_I1F_MINUS_ONE = _I1F - 1
+
 def atomic_mass(isotope):
     """Return atomic mass of isotope in atomic mass units.
 
@@ -210,14 +255,15 @@ def atomic_mass(isotope):
     if not _ATOMIC_MASS:
 
         # Load data from AME2020 file
-        mass_file = os.path.join(os.path.dirname(__file__), 'mass_1.mas20.txt')
-        with open(mass_file, 'r') as ame:
-            # Read lines in file starting at line 37
-            for line in itertools.islice(ame, 36, None):
-                name = f'{line[20:22].strip()}{int(line[16:19])}'
-                mass = float(line[106:109]) + 1e-6*float(
-                    line[110:116] + '.' + line[117:123])
-                _ATOMIC_MASS[name.lower()] = mass
+        mass_file = Path(__file__).with_name('mass_1.mas20.txt')
+        # Read lines in file starting at line 37
+        lines = mass_file.read_text().splitlines()[36:]
+        _ATOMIC_MASS.update({
+            f'{line[20:22].strip()}{int(line[16:19])}'.lower():
+            float(line[106:109]) + 1e-6*float(
+                line[110:116] + '.' + line[117:123])
+            for line in lines
+        })
 
         # For isotopes found in some libraries that represent all natural
         # isotopes of their element (e.g. C0), calculate the atomic mass as
@@ -236,6 +282,7 @@ def atomic_mass(isotope):
     return _ATOMIC_MASS[isotope.lower()]
 
 
+@lru_cache(maxsize=None)
 def atomic_weight(element):
     """Return atomic weight of an element in atomic mass units.
 
@@ -384,32 +431,14 @@ def water_density(temperature, pressure=0.1013):
     R_GAS_CONSTANT = 0.461526  # kJ / kg / K
     ref_p = 16.53  # MPa
     ref_T = 1386  # K
-    n1f = [0.14632971213167, -0.84548187169114, -0.37563603672040e1,
-           0.33855169168385e1, -0.95791963387872, 0.15772038513228,
-           -0.16616417199501e-1, 0.81214629983568e-3, 0.28319080123804e-3,
-           -0.60706301565874e-3, -0.18990068218419e-1, -0.32529748770505e-1,
-           -0.21841717175414e-1, -0.52838357969930e-4, -0.47184321073267e-3,
-           -0.30001780793026e-3, 0.47661393906987e-4, -0.44141845330846e-5,
-           -0.72694996297594e-15, -0.31679644845054e-4, -0.28270797985312e-5,
-           -0.85205128120103e-9, -0.22425281908000e-5, -0.65171222895601e-6,
-           -0.14341729937924e-12, -0.40516996860117e-6, -0.12734301741641e-8,
-           -0.17424871230634e-9, -0.68762131295531e-18, 0.14478307828521e-19,
-           0.26335781662795e-22, -0.11947622640071e-22, 0.18228094581404e-23,
-           -0.93537087292458e-25]
-    I1f = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4,
-           4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32]
-    J1f = [-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4,
-           0, 6, -5, -2, 10, -8, -11, -6, -29, -31, -38, -39, -40, -41]
-
     # Nondimensionalize the pressure and temperature.
     pi = pressure / ref_p
     tau = ref_T / temperature
 
     # Compute the derivative of gamma (dimensionless Gibbs free energy) with
     # respect to pi.
-    gamma1_pi = 0.0
-    for n, I, J in zip(n1f, I1f, J1f):
-        gamma1_pi -= n * I * (7.1 - pi)**(I - 1) * (tau - 1.222)**J
+    gamma1_pi = -float(np.dot(_N_I1F, np.power(7.1 - pi, _I1F_MINUS_ONE)
+                              * np.power(tau - 1.222, _J1F)))
 
     # Compute the leading coefficient.  This sets the units at
     #   1 [MPa] * [kg K / kJ] * [1 / K]
@@ -477,12 +506,7 @@ def isotopes(element):
         element = symbol
 
     # Get the nuclides present in nature
-    result = []
-    for kv in NATURAL_ABUNDANCE.items():
-        if re.match(r'{}\d+'.format(element), kv[0]):
-            result.append(kv)
-
-    return result
+    return list(_ISOTOPES_BY_ELEMENT.get(element, []))
 
 
 def zam(name):
@@ -499,6 +523,18 @@ def zam(name):
         Atomic number, mass number, and metastable state
 
     """
+    # Fast path for the common forms 'U235' and 'Am242_m1' that avoids the
+    # regular expression engine
+    base, sep, state = name.partition('_')
+    symbol = base.rstrip('0123456789')
+    A = base[len(symbol):]
+    if symbol in ATOMIC_NUMBER and A:
+        if not sep:
+            return (ATOMIC_NUMBER[symbol], int(A), 0)
+        m = state[1:]
+        if state[:1] in ('m', 'e') and m.isascii() and m.isdigit():
+            return (ATOMIC_NUMBER[symbol], int(A), int(m))
+
     try:
         symbol, A, state = _GNDS_NAME_RE.match(name).groups()
     except AttributeError:
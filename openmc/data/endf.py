@@ -7,6 +7,7 @@ http://www-nds.iaea.org/ndspub/documents/endf/endf102/endf102.pdf
 
 """
 import io
+import mmap
 from pathlib import PurePath
 import re
 
@@ -15,7 +16,7 @@ import numpy as np
 from .data import gnds_name
 from .function import Tabulated1D
 try:
-    from ._endf import float_endf
+    from ._endf import float_endf, float_endf_block
     _CYTHON = True
 except ImportError:
     _CYTHON = False
@@ -67,6 +68,17 @@ SUM_RULES = {1: [2, 3],
 
 ENDF_FLOAT_RE = re.compile(r'([\s\-\+]?\d*\.\d+)([\+\-]) ?(\d+)')
 
+# Layout of an 80-column ENDF-6 record including its newline
+_RECORD_DTYPE = np.dtype([('data', 'S66'), ('mat', 'S4'), ('mf', 'S2'),
+                          ('mt', 'S3'), ('ns', 'S5'), ('newline', 'S1')])
+
+# Control columns of a record, copied out of the memory map when indexing
+_CONTROL_DTYPE = np.dtype([('mat', 'S4'), ('mf', 'S2'), ('mt', 'S3'),
+                           ('newline', 'S1')])
+
+# MAT/MF/MT columns of the MEND record that terminates a material
+_MEND_CONTROL = b'   0 0  0'
+
 
 def py_float_endf(s):
     """Convert string of floating point number in ENDF to float.
@@ -91,8 +103,82 @@ def py_float_endf(s):
     return float(ENDF_FLOAT_RE.sub(r'\1e\2\3', s))
 
 
+def _decode_floats(buf):
+    """Convert a buffer of packed 11-character ENDF fields to floats.
+
+    This is a vectorized equivalent of calling :func:`py_float_endf` on each
+    field: whitespace is removed, 'd'/'D'/'E' exponent markers are normalized
+    to 'e', and an 'e' is inserted ahead of any sign that follows the
+    significand.
+
+    Parameters
+    ----------
+    buf : bytes
+        Concatenated fields, each exactly 11 characters wide
+
+    Returns
+    -------
+    numpy.ndarray
+        The values
+
+    """
+    chars = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 11)
+    chars = np.where(np.isin(chars, np.frombuffer(b'dDE', np.uint8)),
+                     ord('e'), chars)
+
+    # Move blanks to the end of each field, preserving order of the rest
+    order = np.argsort(chars == ord(' '), axis=1, kind='stable')
+    chars = np.take_along_axis(chars, order, axis=1)
+
+    # Find signs that start an exponent lacking an explicit 'e'
+    is_sign = (chars == ord('+')) | (chars == ord('-'))
+    prev = np.empty_like(chars)
+    prev[:, 0] = ord('e')
+    prev[:, 1:] = chars[:, :-1]
+    insert = is_sign & (prev != ord('e'))
+
+    # Shift characters right to make room for the inserted 'e'
+    shift = np.cumsum(insert, axis=1)
+    rows, cols = np.indices(chars.shape)
+    out = np.full((chars.shape[0], 12), ord(' '), dtype=np.uint8)
+    out[rows, cols + shift] = chars
+    r, c = np.nonzero(insert)
+    out[r, c + shift[r, c] - 1] = ord('e')
+
+    # A field of all blanks is interpreted as zero
+    out[out[:, 0] == ord(' '), 0] = ord('0')
+
+    return out.view('S12').ravel().astype(np.float64)
+
+
+def py_float_endf_block(file_obj, n):
+    """Read floating point numbers stored six per record from an ENDF-6 file.
+
+    Parameters
+    ----------
+    file_obj : file-like object
+        ENDF-6 file to read from, positioned at the first record of the block
+    n : int
+        Number of values to read
+
+    Returns
+    -------
+    numpy.ndarray
+        The values
+
+    """
+    n_lines = (n - 1)//6 + 1 if n > 0 else 0
+    buf = ''.join(file_obj.readline().rstrip('\r\n')[:66].ljust(66)
+                  for _ in range(n_lines))
+
+    # Only decode the fields holding values; the rest of the last record may
+    # contain anything
+    return _decode_floats(buf[:11*n].encode())
+
+
 if not _CYTHON:
     float_endf = py_float_endf
+    float_endf_block = py_float_endf_block
 
 
 def int_endf(s):
@@ -208,12 +294,7 @@ def get_list_record(file_obj):
     NPL = items[4]
 
     # read items
-    b = []
-    for i in range((NPL - 1)//6 + 1):
-        line = file_obj.readline()
-        n = min(6, NPL - 6*i)
-        for j in range(n):
-            b.append(float_endf(line[11*j:11*(j + 1)]))
+    b = float_endf_block(file_obj, NPL).tolist()
 
     return (items, b)
 
@@ -258,17 +339,9 @@ def get_tab1_record(file_obj):
             m += 1
 
     # Read tabulated pairs x(n) and y(n)
-    x = np.zeros(n_pairs)
-    y = np.zeros(n_pairs)
-    m = 0
-    for i in range((n_pairs - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_pairs - m)
-        for j in range(to_read):
-            x[m] = float_endf(line[:11])
-            y[m] = float_endf(line[11:22])
-            line = line[22:]
-            m += 1
+    xy = float_endf_block(file_obj, 2*n_pairs)
+    x = xy[0::2].copy()
+    y = xy[1::2].copy()
 
     return params, Tabulated1D(x, y, breakpoints, interpolation)
 
@@ -338,6 +411,72 @@ def get_intg_record(file_obj):
     return corr
 
 
+def _index_sections(buf, offset, mat):
+    """Locate the sections of a material using its MAT/MF/MT columns.
+
+    Parameters
+    ----------
+    buf : mmap.mmap
+        Memory-mapped ENDF-6 file
+    offset : int
+        Position of the first record of the material
+    mat : int
+        MAT number of the material
+
+    Returns
+    -------
+    tuple or None
+        List of (MF, MT, start, end) byte ranges of each section and the
+        position just past the MEND record, or None if the records are not
+        all 80 columns wide or do not all belong to the material, in which
+        case the file must be scanned line by line
+
+    """
+    width = _RECORD_DTYPE.itemsize
+    column = _RECORD_DTYPE.fields['mat'][1]
+
+    # Find the MEND record that terminates the material so that only the
+    # records of this material are examined
+    pos = buf.find(_MEND_CONTROL, offset)
+    while pos >= 0 and (pos - offset) % width != column:
+        pos = buf.find(_MEND_CONTROL, pos + 1)
+    if pos < 0:
+        return None
+    mend = (pos - offset) // width
+    if offset + width*(mend + 1) > len(buf):
+        return None
+
+    # Copy the control columns so that no view of the buffer is left behind if
+    # an exception is raised, which would prevent the memory map from closing
+    control = np.empty(mend + 1, dtype=_CONTROL_DTYPE)
+    records = np.frombuffer(buf, _RECORD_DTYPE, count=mend + 1, offset=offset)
+    for name in _CONTROL_DTYPE.names:
+        control[name] = records[name]
+    del records
+
+    # The records can only be interpreted if they are all 80 columns wide
+    if np.any(control['newline'] != b'\n'):
+        return None
+
+    # If the MEND record is malformed, the search above runs on into the next
+    # material, so check that every record before it belongs to this one
+    if np.any(control['mat'][:mend] != b'%4d' % mat):
+        return None
+
+    # Each section is a run of records terminated by a SEND record (MT = 0)
+    data = np.empty(mend + 2, dtype=np.int8)
+    data[0] = data[-1] = 0
+    data[1:-1] = control['mt'][:mend] != b'  0'
+    edges = np.diff(data)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    sections = [(int(control['mf'][i]), int(control['mt'][i]),
+                 offset + width*i, offset + width*j)
+                for i, j in zip(starts, ends)]
+    return sections, offset + width*(mend + 1)
+
+
 def get_evaluations(filename):
     """Return a list of all evaluations within an ENDF file.
 
@@ -353,11 +492,12 @@ def get_evaluations(filename):
 
     """
     evaluations = []
-    with open(str(filename), 'r') as fh:
+    with open(str(filename), 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as fh:
         while True:
             pos = fh.tell()
             line = fh.readline()
-            if line[66:70] == '  -1':
+            if not line or line[66:70] == b'  -1':
                 break
             fh.seek(pos)
             evaluations.append(Evaluation(fh))
@@ -389,18 +529,36 @@ class Evaluation:
 
     """
     def __init__(self, filename_or_obj):
-        if isinstance(filename_or_obj, (str, PurePath)):
-            fh = open(str(filename_or_obj), 'r')
-            need_to_close = True
-        else:
-            fh = filename_or_obj
-            need_to_close = False
         self.section = {}
         self.info = {}
         self.target = {}
         self.projectile = {}
         self.reaction_list = []
 
+        if isinstance(filename_or_obj, (str, PurePath)):
+            # Memory-map the file so that sections can be sliced out directly
+            # rather than being assembled line by line
+            with open(str(filename_or_obj), 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as fh:
+                    self._read_sections(fh)
+        else:
+            self._read_sections(filename_or_obj)
+
+        self._read_header()
+
+    def _read_sections(self, fh):
+        """Read the raw text of each section of the material
+
+        Parameters
+        ----------
+        fh : file-like or mmap.mmap
+            Open text file or memory-mapped file positioned at the start of an
+            ENDF material
+
+        """
+        binary = isinstance(fh, mmap.mmap)
+        SEND = b'  0' if binary else '  0'
+
         # Skip TPID record. Evaluators sometimes put in TPID records that are
         # ill-formated because they lack MF/MT values or put them in the wrong
         # columns.
@@ -416,6 +574,15 @@ class Evaluation:
         self.material = int(line[66:70])
         fh.seek(position)
 
+        if binary:
+            index = _index_sections(fh, position, self.material)
+            if index is not None:
+                sections, end = index
+                for MF, MT, start, stop in sections:
+                    self.section[MF, MT] = fh[start:stop].decode()
+                fh.seek(end)
+                return
+
         while True:
             # Find next section
             while True:
@@ -433,20 +600,26 @@ class Evaluation:
                 fh.readline()
                 break
 
-            section_data = ''
-            while True:
-                line = fh.readline()
-                if line[72:75] == '  0':
-                    break
-                else:
-                    section_data += line
+            if binary:
+                start = end = fh.tell()
+                while True:
+                    line = fh.readline()
+                    if not line or line[72:75] == SEND:
+                        break
+                    end = fh.tell()
+                section_data = fh[start:end].decode()
+                if '\r' in section_data:
+                    section_data = section_data.replace('\r\n', '\n')
+            else:
+                section_data = ''
+                while True:
+                    line = fh.readline()
+                    if line[72:75] == SEND:
+                        break
+                    else:
+                        section_data += line
             self.section[MF, MT] = section_data
 
-        if need_to_close:
-            fh.close()
-
-        self._read_header()
-
     def __repr__(self):
         name = self.target['zsymam'].replace(' ', '')
         return '<{} for {} {}>'.format(self.info['sublibrary'], name,
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Callable
 from functools import reduce
+import importlib.util
 from itertools import zip_longest
 from math import exp, log
 from numbers import Real, Integral
@@ -11,11 +12,108 @@ import openmc.checkvalue as cv
 import openmc.data
 from openmc.mixin import EqualityMixin
 from .data import EV_PER_MEV
+try:
+    # Prefer the precompiled kernel, which avoids JIT compilation on first use
+    from ._function import tab1_eval as _tab1_eval_cython
+    _CYTHON = True
+    _NUMBA = False
+except ImportError:
+    _CYTHON = False
+    # numba is slow to import, so it is only imported once the kernel is needed
+    _NUMBA = importlib.util.find_spec('numba') is not None
+
+# Replaced by numba.prange when the kernel below is compiled with numba
+prange = range
 
 INTERPOLATION_SCHEME = {1: 'histogram', 2: 'linear-linear', 3: 'linear-log',
                         4: 'log-linear', 5: 'log-log'}
 
 
+def _tab1_eval(x, y, breakpoints, interpolation, xin, out):
+    """Evaluate a tabulated function at an array of points
+
+    This kernel is compiled with numba when it is available, in which case the
+    loop over points is distributed across threads. Points outside the
+    tabulated range are assigned a value of zero.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Tabulated (x,y) pairs
+    breakpoints, interpolation : numpy.ndarray
+        Breakpoints and ENDF interpolation law for each interpolation region
+    xin : numpy.ndarray
+        Points at which to evaluate the function
+    out : numpy.ndarray
+        Array to write results to
+
+    """
+    n = x.shape[0]
+    for i in prange(xin.shape[0]):
+        xi = xin[i]
+        out[i] = 0.0
+        if not (x[0] <= xi < x[n - 1]):
+            continue
+
+        # Bisect to find idx such that x[idx] <= xi < x[idx + 1]
+        lo = 0
+        hi = n - 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if x[mid] <= xi:
+                lo = mid
+            else:
+                hi = mid
+        idx = lo
+
+        # Determine interpolation region
+        k = 0
+        while k < breakpoints.shape[0] and idx >= breakpoints[k] - 1:
+            k += 1
+        if k == breakpoints.shape[0]:
+            continue
+        p = interpolation[k]
+
+        x0 = x[idx]
+        x1 = x[idx + 1]
+        y0 = y[idx]
+        y1 = y[idx + 1]
+        if p == 1:
+            # Histogram
+            out[i] = y0
+        elif p == 2:
+            # Linear-linear
+            out[i] = y0 + (xi - x0)/(x1 - x0)*(y1 - y0)
+        elif p == 3:
+            # Linear-log
+            out[i] = y0 + np.log(xi/x0)/np.log(x1/x0)*(y1 - y0)
+        elif p == 4:
+            # Log-linear
+            out[i] = y0*np.exp((xi - x0)/(x1 - x0)*np.log(y1/y0))
+        elif p == 5:
+            # Log-log
+            out[i] = y0*np.exp(np.log(xi/x0)/np.log(x1/x0)*np.log(y1/y0))
+
+
+_tab1_eval_numba = None
+
+
+def _numba_kernel():
+    """Return :func:`_tab1_eval` compiled with numba
+
+    numba is imported and the kernel is compiled on the first call, with the
+    loop over points distributed across threads.
+
+    """
+    global _tab1_eval_numba, prange
+    if _tab1_eval_numba is None:
+        import numba
+        prange = numba.prange
+        _tab1_eval_numba = numba.njit(parallel=True, cache=True,
+                                      boundscheck=False)(_tab1_eval)
+    return _tab1_eval_numba
+
+
 def sum_functions(funcs):
     """Add tabulated/polynomials functions together
 
@@ -160,53 +258,110 @@ class Tabulated1D(Function1D):
 
         x = np.array(x)
 
-        # Create output array
-        y = np.zeros_like(x)
+        # A single linear-linear or log-log region (the most common case)
+        # reduces to one call to np.interp, which is faster than either of the
+        # compiled kernels
+        y = None
+        if len(self.breakpoints) == 1 and self.interpolation[0] in (2, 5):
+            y = self._interpolate_interp(x)
+        if y is None:
+            if _CYTHON or _NUMBA:
+                y = self._interpolate_compiled(x)
+            else:
+                y = self._interpolate_numpy(x)
 
-        # Get indices for interpolation
-        idx = np.searchsorted(self.x, x, side='right') - 1
+        # In some cases, x values might be outside the tabulated region due only
+        # to precision, so we check if they're close and set them equal if so.
+        y[np.isclose(x, self.x[0], atol=1e-14)] = self.y[0]
+        y[np.isclose(x, self.x[-1], atol=1e-14)] = self.y[-1]
 
-        # Loop over interpolation regions
-        for k in range(len(self.breakpoints)):
-            # Get indices for the begining and ending of this region
-            i_begin = self.breakpoints[k-1] - 1 if k > 0 else 0
-            i_end = self.breakpoints[k] - 1
+        return y
 
-            # Figure out which idx values lie within this region
-            contained = (idx >= i_begin) & (idx < i_end)
+    def _interpolate_interp(self, x):
+        """Evaluate a single linear-linear or log-log region with np.interp
 
-            xk = x[contained]                 # x values in this region
-            xi = self.x[idx[contained]]       # low edge of corresponding bins
-            xi1 = self.x[idx[contained] + 1]  # high edge of corresponding bins
-            yi = self.y[idx[contained]]
-            yi1 = self.y[idx[contained] + 1]
+        Returns None if the points cannot be handled this way, i.e., if any are
+        NaN or log-log interpolation would involve non-positive values.
 
-            if self.interpolation[k] == 1:
+        """
+        xt = np.asarray(self.x, dtype=float)
+        yt = np.asarray(self.y, dtype=float)
+        x = np.asarray(x, dtype=float)
+        if np.isnan(x).any():
+            return None
+
+        if self.interpolation[0] == 2:
+            return np.interp(x, xt, yt, left=0.0, right=0.0)
+
+        if xt[0] <= 0.0 or (yt <= 0.0).any() or (x <= 0.0).any():
+            return None
+        return np.exp(np.interp(np.log(x), np.log(xt), np.log(yt),
+                                left=-np.inf, right=-np.inf))
+
+    def _interpolate_compiled(self, x):
+        xin = np.ascontiguousarray(x, dtype=float).ravel()
+        y = np.empty_like(xin)
+        kernel = _tab1_eval_cython if _CYTHON else _numba_kernel()
+        kernel(np.ascontiguousarray(self.x, dtype=float),
+               np.ascontiguousarray(self.y, dtype=float),
+               np.ascontiguousarray(self.breakpoints, dtype=np.int64),
+               np.ascontiguousarray(self.interpolation, dtype=np.int64),
+               xin, y)
+        return y.reshape(x.shape)
+
+    def _interpolate_numpy(self, x):
+        # Create output array
+        y = np.zeros_like(x)
+
+        # Get indices for interpolation and the interpolation region that each
+        # index lies in. Points outside the tabulated range are left as zero.
+        idx = np.searchsorted(self.x, x, side='right') - 1
+        region = np.searchsorted(self.breakpoints - 1, idx, side='right')
+        inside = (idx >= 0) & (region < len(self.breakpoints))
+
+        # Gather bounding (x,y) pairs for all points at once
+        i = idx[inside]
+        xk = x[inside]                 # x values within the tabulated range
+        xi = self.x[i]                 # low edge of corresponding bins
+        xi1 = self.x[i + 1]            # high edge of corresponding bins
+        yi = self.y[i]
+        yi1 = self.y[i + 1]
+
+        # In the common case of a single interpolation region, no further
+        # partitioning of the points is needed
+        if len(self.breakpoints) == 1:
+            groups = [(self.interpolation[0], slice(None))]
+        else:
+            law = self.interpolation[region[inside]]
+            groups = [(p, law == p) for p in np.unique(law)]
+
+        yk = np.zeros(xk.shape)
+        for p, m in groups:
+            if p == 1:
                 # Histogram
-                y[contained] = yi
+                yk[m] = yi[m]
 
-            elif self.interpolation[k] == 2:
+            elif p == 2:
                 # Linear-linear
-                y[contained] = yi + (xk - xi)/(xi1 - xi)*(yi1 - yi)
+                yk[m] = yi[m] + ((xk[m] - xi[m])/(xi1[m] - xi[m])
+                                 *(yi1[m] - yi[m]))
 
-            elif self.interpolation[k] == 3:
+            elif p == 3:
                 # Linear-log
-                y[contained] = yi + np.log(xk/xi)/np.log(xi1/xi)*(yi1 - yi)
+                yk[m] = yi[m] + (np.log(xk[m]/xi[m])/np.log(xi1[m]/xi[m])
+                                 *(yi1[m] - yi[m]))
 
-            elif self.interpolation[k] == 4:
+            elif p == 4:
                 # Log-linear
-                y[contained] = yi*np.exp((xk - xi)/(xi1 - xi)*np.log(yi1/yi))
+                yk[m] = yi[m]*np.exp((xk[m] - xi[m])/(xi1[m] - xi[m])
+                                     *np.log(yi1[m]/yi[m]))
 
-            elif self.interpolation[k] == 5:
+            elif p == 5:
                 # Log-log
-                y[contained] = (yi*np.exp(np.log(xk/xi)/np.log(xi1/xi)
-                                *np.log(yi1/yi)))
-
-        # In some cases, x values might be outside the tabulated region due only
-        # to precision, so we check if they're close and set them equal if so.
-        y[np.isclose(x, self.x[0], atol=1e-14)] = self.y[0]
-        y[np.isclose(x, self.x[-1], atol=1e-14)] = self.y[-1]
+                yk[m] = yi[m]*np.exp(np.log(xk[m]/xi[m])/np.log(xi1[m]/xi[m])
+                                     *np.log(yi1[m]/yi[m]))
 
+        y[inside] = yk
         return y
 
     def _interpolate_scalar(self, x):
@@ -107,6 +107,31 @@ _COMPTON_PROFILES = {}
 _BREMSSTRAHLUNG = {}
 
 
+def _chunked_dataset_kwargs(data, chunk_bytes):
+    """Return h5py keyword arguments for writing a chunked, compressed array
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        One-dimensional array that is to be written
+    chunk_bytes : int or None
+        Target size of each chunk in bytes. If None, the dataset is written
+        with the default contiguous layout.
+
+    Returns
+    -------
+    dict
+        Keyword arguments to pass to :meth:`h5py.Group.create_dataset`
+
+    """
+    data = np.asarray(data)
+    if chunk_bytes is None or data.ndim != 1 or data.size == 0:
+        return {}
+    n = min(data.size, max(1, chunk_bytes // data.dtype.itemsize))
+    return {'chunks': (n,), 'compression': 'gzip', 'compression_opts': 1,
+            'shuffle': True}
+
+
 class AtomicRelaxation(EqualityMixin):
     """Atomic relaxation data.
 
@@ -715,7 +740,8 @@ class IncidentPhoton(EqualityMixin):
         return data
 
     @classmethod
-    def from_hdf5(cls, group_or_filename):
+    def from_hdf5(cls, group_or_filename, rdcc_nbytes=64*1024*1024,
+                  rdcc_nslots=521):
         """Generate photon reaction from an HDF5 group
 
         Parameters
@@ -724,6 +750,12 @@ class IncidentPhoton(EqualityMixin):
             HDF5 group containing interaction data. If given as a string, it is
             assumed to be the filename for the HDF5 file, and the first group is
             used to read from.
+        rdcc_nbytes : int
+            Size in bytes of the raw data chunk cache used for each dataset when
+            the file is opened here. Ignored if an HDF5 group is given.
+        rdcc_nslots : int
+            Number of slots in the chunk cache hash table; should be a prime
+            number. Ignored if an HDF5 group is given.
 
         Returns
         -------
@@ -735,7 +767,8 @@ class IncidentPhoton(EqualityMixin):
             group = group_or_filename
             need_to_close = False
         else:
-            h5file = h5py.File(str(group_or_filename), 'r')
+            h5file = h5py.File(str(group_or_filename), 'r',
+                               rdcc_nbytes=rdcc_nbytes, rdcc_nslots=rdcc_nslots)
             need_to_close = True
 
             # Make sure version matches
@@ -803,84 +836,114 @@ class IncidentPhoton(EqualityMixin):
 
         return data
 
-    def export_to_hdf5(self, path, mode='a', libver='earliest'):
+    def export_to_hdf5(self, path, mode='a', libver='earliest',
+                       chunk_bytes=1 << 20):
         """Export incident photon data to an HDF5 file.
 
         Parameters
         ----------
-        path : str
-            Path to write HDF5 file to
+        path : str or h5py.Group
+            Path to write HDF5 file to. If given as an open HDF5 file or group,
+            the data is written to a new group within it, which allows several
+            elements to be stored in a single file.
         mode : {'r+', 'w', 'x', 'a'}
             Mode that is used to open the HDF5 file. This is the second argument
-            to the :class:`h5py.File` constructor.
+            to the :class:`h5py.File` constructor. Ignored if `path` is an open
+            HDF5 group.
         libver : {'earliest', 'latest'}
             Compatibility mode for the HDF5 file. 'latest' will produce files
             that are less backwards compatible but have performance benefits.
+            Ignored if `path` is an open HDF5 group.
+        chunk_bytes : int or None
+            Target chunk size in bytes for the energy grid and cross section
+            datasets, which are written with gzip compression and the shuffle
+            filter. If None, these datasets are stored contiguously without
+            compression.
 
         """
-        with h5py.File(str(path), mode, libver=libver) as f:
-            # Write filetype and version
-            f.attrs['filetype'] = np.string_('data_photon')
-            if 'version' not in f.attrs:
-                f.attrs['version'] = np.array(HDF5_VERSION)
-
-            group = f.create_group(self.name)
-            group.attrs['Z'] = Z = self.atomic_number
-
-            # Determine union energy grid
-            union_grid = np.array([])
-            for rx in self:
-                union_grid = np.union1d(union_grid, rx.xs.x)
-            group.create_dataset('energy', data=union_grid)
-
-            # Write cross sections
-            shell_group = group.create_group('subshells')
-            designators = []
-            for mt, rx in self.reactions.items():
-                name, key = _REACTION_NAME[mt]
-                if mt in (501, 502, 504, 515, 517, 522, 525, 301):              # This should be removed from any official release, mt301 is sometimes eV.Barn, sometimes eV/coll. Here it is eV/coll (525 is eV.barn)
-                    sub_group = group.create_group(key)
-                elif mt >= 534 and mt <= 572:
-                    # Subshell
-                    designators.append(key)
-                    sub_group = shell_group.create_group(key)
-
-                    # Write atomic relaxation
-                    if self.atomic_relaxation is not None:
-                        if key in self.atomic_relaxation.subshells:
-                            self.atomic_relaxation.to_hdf5(sub_group, key)
-                else:
-                    continue
+        if isinstance(path, h5py.Group):
+            self._export_to_hdf5_group(path, chunk_bytes)
+        else:
+            with h5py.File(str(path), mode, libver=libver) as f:
+                self._export_to_hdf5_group(f, chunk_bytes)
 
-                rx.to_hdf5(sub_group, union_grid, Z)
+    def _export_to_hdf5_group(self, parent, chunk_bytes):
+        """Write incident photon data to a new group within an HDF5 group
 
-            shell_group.attrs['designators'] = np.array(designators, dtype='S')
+        Parameters
+        ----------
+        parent : h5py.Group
+            HDF5 group in which a group named after the element is created
+        chunk_bytes : int or None
+            Target chunk size in bytes for the energy grid and cross section
+            datasets
 
-            # Write Compton profiles
-            if self.compton_profiles:
-                compton_group = group.create_group('compton_profiles')
+        """
+        # Write filetype and version
+        f = parent.file
+        f.attrs['filetype'] = np.string_('data_photon')
+        if 'version' not in f.attrs:
+            f.attrs['version'] = np.array(HDF5_VERSION)
+
+        group = parent.create_group(self.name)
+        group.attrs['Z'] = Z = self.atomic_number
+
+        # Determine union energy grid
+        union_grid = np.array([])
+        for rx in self:
+            union_grid = np.union1d(union_grid, rx.xs.x)
+        group.create_dataset('energy', data=union_grid,
+                             **_chunked_dataset_kwargs(union_grid,
+                                                       chunk_bytes))
 
-                profile = self.compton_profiles
-                compton_group.create_dataset('num_electrons',
-                                            data=profile['num_electrons'])
-                compton_group.create_dataset('binding_energy',
-                                            data=profile['binding_energy'])
+        # Write cross sections
+        shell_group = group.create_group('subshells')
+        designators = []
+        for mt, rx in self.reactions.items():
+            name, key = _REACTION_NAME[mt]
+            if mt in (501, 502, 504, 515, 517, 522, 525, 301):              # This should be removed from any official release, mt301 is sometimes eV.Barn, sometimes eV/coll. Here it is eV/coll (525 is eV.barn)
+                sub_group = group.create_group(key)
+            elif mt >= 534 and mt <= 572:
+                # Subshell
+                designators.append(key)
+                sub_group = shell_group.create_group(key)
+
+                # Write atomic relaxation
+                if self.atomic_relaxation is not None:
+                    if key in self.atomic_relaxation.subshells:
+                        self.atomic_relaxation.to_hdf5(sub_group, key)
+            else:
+                continue
 
-                # Get electron momentum values
-                compton_group.create_dataset('pz', data=profile['J'][0].x)
+            rx.to_hdf5(sub_group, union_grid, Z, chunk_bytes)
 
-                # Create/write 2D array of profiles
-                J = np.array([Jk.y for Jk in profile['J']])
-                compton_group.create_dataset('J', data=J)
+        shell_group.attrs['designators'] = np.array(designators, dtype='S')
 
-            # Write bremsstrahlung
-            if self.bremsstrahlung:
-                brem_group = group.create_group('bremsstrahlung')
-                for key, value in self.bremsstrahlung.items():
-                    if key == 'I':
-                        brem_group.attrs[key] = value
-                    else:
-                        brem_group.create_dataset(key, data=value)
+        # Write Compton profiles
+        if self.compton_profiles:
+            compton_group = group.create_group('compton_profiles')
+
+            profile = self.compton_profiles
+            compton_group.create_dataset('num_electrons',
+                                        data=profile['num_electrons'])
+            compton_group.create_dataset('binding_energy',
+                                        data=profile['binding_energy'])
+
+            # Get electron momentum values
+            compton_group.create_dataset('pz', data=profile['J'][0].x)
+
+            # Create/write 2D array of profiles
+            J = np.array([Jk.y for Jk in profile['J']])
+            compton_group.create_dataset('J', data=J)
+
+        # Write bremsstrahlung
+        if self.bremsstrahlung:
+            brem_group = group.create_group('bremsstrahlung')
+            for key, value in self.bremsstrahlung.items():
+                if key == 'I':
+                    brem_group.attrs[key] = value
+                else:
+                    brem_group.create_dataset(key, data=value)
 
     def _add_bremsstrahlung(self):
         """Add the data used in the thick-target bremsstrahlung approximation
@@ -1287,7 +1350,7 @@ class PhotonReaction(EqualityMixin):
 
         return rx
 
-    def to_hdf5(self, group, energy, Z):
+    def to_hdf5(self, group, energy, Z, chunk_bytes=None):
         """Write photon reaction to an HDF5 group
 
         Parameters
@@ -1298,6 +1361,10 @@ class PhotonReaction(EqualityMixin):
             arrays of energies at which cross sections are tabulated at
         Z : int
             atomic number
+        chunk_bytes : int or None
+            Target chunk size in bytes for the cross section dataset, which is
+            written with gzip compression and the shuffle filter. If None, the
+            dataset is stored contiguously without compression.
 
         """
 
@@ -1309,11 +1376,15 @@ class PhotonReaction(EqualityMixin):
 
             # Interpolate cross section onto union grid and write
             photoionization = self.xs(energy[idx:])
-            group.create_dataset('xs', data=photoionization)
+            group.create_dataset('xs', data=photoionization,
+                                 **_chunked_dataset_kwargs(photoionization,
+                                                           chunk_bytes))
             assert len(energy) == len(photoionization) + idx
             group['xs'].attrs['threshold_idx'] = idx
         else:
-            group.create_dataset('xs', data=self.xs(energy))
+            xs = self.xs(energy)
+            group.create_dataset('xs', data=xs,
+                                 **_chunked_dataset_kwargs(xs, chunk_bytes))
 
         # Write scattering factor
         if self.scattering_factor is not None:
@@ -1,11 +1,15 @@
 #!/usr/bin/env python
 
 import glob
+import os
+import re
+import shutil
 import sys
+import sysconfig
 import numpy as np
 
-from setuptools import setup, find_packages
-from Cython.Build import cythonize
+from setuptools import setup, find_packages, Extension
+from setuptools.command.build_ext import build_ext
 
 
 # Determine shared library suffix
@@ -14,16 +18,46 @@ if sys.platform == 'darwin':
 else:
     suffix = 'so'
 
-# Get version information from __init__.py. This is ugly, but more reliable than
-# using an import.
+# Optionally compile the Cython extensions with OpenMP so that their prange
+# loops run in parallel
+extra_compile_args = []
+extra_link_args = []
+if os.environ.get('OPENMC_OPENMP') == '1':
+    if sys.platform == 'darwin':
+        # Apple clang needs the OpenMP runtime from libomp
+        extra_compile_args += ['-Xpreprocessor', '-fopenmp']
+        extra_link_args += ['-lomp']
+    else:
+        extra_compile_args += ['-fopenmp']
+        extra_link_args += ['-fopenmp']
+
+# Use ccache for the extension modules when it is available so that repeated
+# builds (e.g., editable installs) don't recompile unchanged sources
+_cc = sysconfig.get_config_var('CC')
+if _cc and 'CC' not in os.environ and shutil.which('ccache'):
+    os.environ['CC'] = 'ccache ' + _cc
+
+
+class BuildExt(build_ext):
+    """Build extension modules in parallel unless told otherwise"""
+    def finalize_options(self):
+        super().finalize_options()
+        if self.parallel is None:
+            self.parallel = os.cpu_count()
+
+
+# Get version information from __init__.py. This is more reliable than using an
+# import, and doesn't depend on __version__ being the last line of the file.
 with open('openmc/__init__.py', 'r') as f:
-    version = f.readlines()[-1].split()[-1].strip("'")
+    version = re.search(r"^__version__\s*=\s*['\"]([^'\"]+)['\"]",
+                        f.read(), re.MULTILINE).group(1)
 
 kwargs = {
     'name': 'openmc',
     'version': version,
     'packages': find_packages(exclude=['tests*']),
     'scripts': glob.glob('scripts/openmc-*'),
+    'cmdclass': {'build_ext': BuildExt},
 
     # Data files and libraries
     'package_data': {
@@ -71,12 +105,36 @@ kwargs = {
         'depletion-mpi': ['mpi4py'],
         'docs': ['sphinx', 'sphinxcontrib-katex', 'sphinx-numfig', 'jupyter',
                  'sphinxcontrib-svg2pdfconverter', 'sphinx-rtd-theme'],
+        'jit': ['numba>=0.57'],
         'test': ['pytest', 'pytest-cov', 'colorama'],
         'vtk': ['vtk'],
     },
-    # Cython is used to add resonance reconstruction and fast float_endf
-    'ext_modules': cythonize('openmc/data/*.pyx'),
-    'include_dirs': [np.get_include()]
 }
 
-setup(**kwargs)
+# cythonize() compiles modules in a process pool whose workers re-import this
+# file under the 'spawn' start method, so setup() must only run in the main
+# process
+if __name__ == '__main__':
+    # Cython is used to add resonance reconstruction, fast float_endf, and
+    # Tabulated1D evaluation. Setting OPENMC_BACKEND=numba skips compiling the
+    # extensions, in which case openmc.data uses its Python and numba code
+    # paths and resonance reconstruction is unavailable.
+    if os.environ.get('OPENMC_BACKEND') != 'numba':
+        from Cython.Build import cythonize
+        kwargs['ext_modules'] = cythonize([
+            Extension('openmc.data.*', ['openmc/data/*.pyx'],
+                      extra_compile_args=extra_compile_args,
+                      extra_link_args=extra_link_args)
+        ], nthreads=os.cpu_count() or 1, compiler_directives={
+            # Modules that need checked indexing can re-enable it with a
+            # '# cython: boundscheck=True' header
+            'language_level': 3,
+            'boundscheck': False,
+            'wraparound': False,
+            'cdivision': True,
+            'initializedcheck': False,
+            'nonecheck': False,
+        })
+        kwargs['include_dirs'] = [np.get_include()]
+
+    setup(**kwargs)
@@ -176,15 +176,23 @@ hid_t file_open(const char* filename, char mode, bool parallel)
     fatal_error(fmt::format("Invalid file mode: ", mode));
   }
 
-  hid_t plist = H5P_DEFAULT;
+  hid_t plist = H5Pcreate(H5P_FILE_ACCESS);
 #ifdef PHDF5
   if (parallel) {
     // Setup file access property list with parallel I/O access
-    plist = H5Pcreate(H5P_FILE_ACCESS);
     H5Pset_fapl_mpio(plist, openmc::mpi::intracomm, MPI_INFO_NULL);
   }
 #endif
 
+  if (!create) {
+    // Enlarge the raw data chunk cache from its 1 MiB default so that reading
+    // chunked (e.g., compressed) datasets such as large energy grids doesn't
+    // repeatedly decompress the same chunks. The number of hash table slots
+    // is a prime about ten times the number of 1 MiB chunks (the size written
+    // by openmc.data) that fit.
+    H5Pset_cache(plist, 0, 317, 32 * 1024 * 1024, 0.75);
+  }
+
   // Open the file collectively
   hid_t file_id;
   if (create) {
@@ -197,11 +205,8 @@ hid_t file_open(const char* filename, char mode, bool parallel)
       "Failed to open HDF5 file with mode '{}': {}", mode, filename));
   }
 
-#ifdef PHDF5
   // Close the property list
-  if (parallel)
-    H5Pclose(plist);
-#endif
+  H5Pclose(plist);
 
   return file_id;
 }
@@ -69,6 +69,47 @@ def test_linearize():
     assert f(0.32) == pytest.approx(1 - 0.32*0.32, 0.001)
 
 
+@pytest.mark.parametrize("interpolation", [1, 2, 3, 4, 5])
+def test_tabulated1d_array(interpolation):
+    """Test array evaluation of a tabulated function against scalar calls."""
+    x = [1.0, 2.0, 5.0, 10.0]
+    y = [4.0, 3.0, 6.0, 1.0]
+    f = openmc.data.Tabulated1D(x, y, [len(x)], [interpolation])
+    energies = np.array([0.5, 1.0, 1.5, 2.0, 3.7, 9.9, 10.0, 11.0])
+    expected = [f(e) if 1.0 <= e <= 10.0 else 0.0 for e in energies]
+    assert f(energies) == pytest.approx(expected)
+    assert f._interpolate_numpy(energies)[1:-2] == pytest.approx(expected[1:-2])
+    if interpolation in (2, 5):
+        y_interp = f._interpolate_interp(energies)
+        assert y_interp[1:-2] == pytest.approx(expected[1:-2])
+        assert y_interp[[0, -1]] == pytest.approx([0.0, 0.0])
+
+
+def test_tabulated1d_numba():
+    """Test the numba kernel against the numpy implementation."""
+    pytest.importorskip('numba')
+    from openmc.data.function import _numba_kernel
+
+    # One region for each interpolation law
+    x = np.linspace(1.0, 16.0, 16)
+    y = 1.0 + (x - 4.0)**2
+    breakpoints = [3, 6, 9, 12, 16]
+    interpolation = [1, 2, 3, 4, 5]
+    f = openmc.data.Tabulated1D(x, y, breakpoints, interpolation)
+
+    # Enough points that the loop is split across threads, plus points outside
+    # the tabulated range and NaN
+    rng = np.random.default_rng(1)
+    energies = np.concatenate([rng.uniform(0.0, 17.0, 10000), x[:-1],
+                               [-1.0, 0.5, 16.5, np.nan]])
+
+    y_numba = np.empty_like(energies)
+    _numba_kernel()(f.x, f.y, f.breakpoints.astype(np.int64),
+                    f.interpolation.astype(np.int64), energies, y_numba)
+    assert y_numba == pytest.approx(f._interpolate_numpy(energies))
+    assert np.all(y_numba[-4:] == 0.0)
+
+
 def test_thin():
     """Test thinning of a tabulated function."""
     x = np.linspace(0., 2*np.pi, 1000)
@@ -102,6 +143,7 @@ def test_water_density():
     assert dens(300.0, 3.0) == pytest.approx(1e-3/0.100215168e-2, 1e-6)
     assert dens(300.0, 80.0) == pytest.approx(1e-3/0.971180894e-3, 1e-6)
     assert dens(500.0, 3.0) == pytest.approx(1e-3/0.120241800e-2, 1e-6)
+    assert type(dens(300.0, 3.0)) is float
 
 
 def test_gnds_name():
@@ -123,14 +165,27 @@ def test_isotopes():
         openmc.data.isotopes('Чорнобиль')
 
 
+def test_periodic_table():
+    table = openmc.data.PERIODIC_TABLE
+    assert len(table) == 100
+    assert table[0] == 'H'
+    assert table[-1] == 'Fm'
+    assert all(openmc.data.ATOMIC_NUMBER[s] == z
+               for z, s in enumerate(table, 1))
+
+
 def test_zam():
     assert openmc.data.zam('H1') == (1, 1, 0)
     assert openmc.data.zam('Zr90') == (40, 90, 0)
     assert openmc.data.zam('Am242') == (95, 242, 0)
     assert openmc.data.zam('Am242_m1') == (95, 242, 1)
     assert openmc.data.zam('Am242_m10') == (95, 242, 10)
+    assert openmc.data.zam('Am242_e2') == (95, 242, 2)
+    assert openmc.data.zam('U235_x') == (92, 235, 0)
     with pytest.raises(ValueError):
         openmc.data.zam('garbage')
+    with pytest.raises(ValueError):
+        openmc.data.zam('Xx12')
 
 
 def test_half_life():
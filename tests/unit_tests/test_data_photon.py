@@ -4,6 +4,7 @@ from collections.abc import Mapping, Callable
 import os
 from pathlib import Path
 
+import h5py
 import numpy as np
 import pandas as pd
 import pytest
@@ -146,6 +147,86 @@ def test_export_to_hdf5(tmpdir, element):
     # Export to hdf5 again
     element2.export_to_hdf5(filename, 'w')
 
+
+def _synthetic_element(Z):
+    """Return an IncidentPhoton with a few made-up cross sections"""
+    element = openmc.data.IncidentPhoton(Z)
+    for mt in (502, 504, 522):
+        rx = openmc.data.PhotonReaction(mt)
+        energy = np.logspace(0, 9, 40 + Z)
+        rx.xs = openmc.data.Tabulated1D(energy, Z*np.sqrt(energy) + mt)
+        element.reactions[mt] = rx
+    return element
+
+
+def test_export_to_hdf5_group(tmpdir):
+    # Write several elements into one open file
+    filename = str(tmpdir.join('elements.h5'))
+    elements = [_synthetic_element(Z) for Z in (1, 2, 3)]
+    with h5py.File(filename, 'w') as f:
+        for element in elements:
+            element.export_to_hdf5(f)
+
+    with h5py.File(filename, 'r') as f:
+        assert f.attrs['filetype'] == b'data_photon'
+        assert sorted(f) == ['H', 'He', 'Li']
+        for element in elements:
+            element2 = openmc.data.IncidentPhoton.from_hdf5(f[element.name])
+            assert element2.atomic_number == element.atomic_number
+            assert list(element2.reactions) == list(element.reactions)
+            for mt, rx in element.reactions.items():
+                assert element2[mt].xs(rx.xs.x) == pytest.approx(rx.xs.y)
+
+
+def test_export_to_hdf5_chunks(tmpdir):
+    # Add a subshell whose threshold lies above the start of the union grid
+    element = _synthetic_element(1)
+    rx = openmc.data.PhotonReaction(534)
+    energy = np.logspace(3, 9, 20)
+    rx.xs = openmc.data.Tabulated1D(energy, 1.0/energy, [20], [5])
+    element.reactions[534] = rx
+
+    filename = str(tmpdir.join('chunked.h5'))
+    element.export_to_hdf5(filename, 'w', chunk_bytes=256)
+    with h5py.File(filename, 'r') as f:
+        for name in ('energy', 'coherent/xs', 'subshells/K/xs'):
+            dset = f['H'][name]
+            assert dset.chunks == (32,)
+            assert dset.compression == 'gzip'
+            assert dset.shuffle
+
+        # Subshell cross sections are only written above the threshold
+        union_grid = f['H/energy'][()]
+        idx = f['H/subshells/K/xs'].attrs['threshold_idx']
+        assert union_grid[idx] == 1e3
+        assert f['H/subshells/K/xs'][()] == pytest.approx(1.0/union_grid[idx:])
+
+        element2 = openmc.data.IncidentPhoton.from_hdf5(f['H'])
+        assert element2[534].xs.x == pytest.approx(union_grid[idx:])
+        assert element2[534].xs(energy) == pytest.approx(1.0/energy)
+
+    # Without a chunk size, datasets are stored contiguously
+    element.export_to_hdf5(filename, 'w', chunk_bytes=None)
+    with h5py.File(filename, 'r') as f:
+        for name in ('energy', 'coherent/xs', 'subshells/K/xs'):
+            dset = f['H'][name]
+            assert dset.chunks is None
+            assert dset.compression is None
+
+
+def test_from_hdf5_chunk_cache(tmpdir):
+    # Reading from a filename opens the file with the given chunk cache
+    filename = str(tmpdir.join('H.h5'))
+    element = _synthetic_element(1)
+    element.export_to_hdf5(filename, 'w', chunk_bytes=256)
+
+    element2 = openmc.data.IncidentPhoton.from_hdf5(
+        filename, rdcc_nbytes=1 << 20, rdcc_nslots=101)
+    assert element2.atomic_number == 1
+    for mt, rx in element.reactions.items():
+        assert element2[mt].xs(rx.xs.x) == pytest.approx(rx.xs.y)
+
+
 def test_photodat_only(run_in_tmpdir):
     endf_dir = Path(os.environ['OPENMC_ENDF_DATA'])
     photoatomic_file = endf_dir / 'photoat' / 'photoat-001_H_000.endf'
@@ -1,4 +1,7 @@
+import io
+
 from openmc.data import endf
+import pytest
 from pytest import approx
 
 
@@ -28,3 +31,166 @@ def test_float_endf():
 def test_int_endf():
     assert endf.int_endf('    ') == 0
     assert endf.int_endf('+4032') == 4032
+
+
+def test_float_endf_block():
+    text = (
+        ' 1.000000-5 2.000000+0 3.000000+1 4.000000+2 5.000000+3 6.000000+49228 1451    1\n'
+        '-7.000000-1 8.000000+0                                            9228 1451    2\n'
+    )
+    expected = [1e-5, 2.0, 30.0, 400.0, 5000.0, 6e4, -0.7, 8.0]
+    for func in (endf.float_endf_block, endf.py_float_endf_block):
+        values = func(io.StringIO(text), 8)
+        assert values == approx(expected)
+    assert len(endf.float_endf_block(io.StringIO(''), 0)) == 0
+
+    # Unused fields in the last record are ignored
+    text = ' 1.000000+0 2.000000+0 3.000000+0   junkjunk                      9228 1451    1\n'
+    for func in (endf.float_endf_block, endf.py_float_endf_block):
+        values = func(io.StringIO(text), 3)
+        assert values == approx([1.0, 2.0, 3.0])
+
+
+def test_tab1_record():
+    text = (
+        ' 0.000000+0 0.000000+0          0          0          1          39228 3  1    1\n'
+        '          3          2                                            9228 3  1    2\n'
+        ' 1.000000-5 1.000000+1 1.000000+0 2.000000+1 2.000000+0 3.000000+19228 3  1    3\n'
+    )
+    params, f = endf.get_tab1_record(io.StringIO(text))
+    assert params == [0.0, 0.0, 0, 0]
+    assert f.x == approx([1e-5, 1.0, 2.0])
+    assert f.y == approx([10.0, 20.0, 30.0])
+    assert f(1.5) == approx(25.0)
+
+
+def test_decode_floats():
+    fields = [' +1.01+ 2', '+ 2 . 3+ 1', '3.14d-1', '-1.+2', '', '-1.0e+05']
+    buf = ''.join(s.ljust(11) for s in fields).encode()
+    values = endf._decode_floats(buf)
+    assert values == approx([101.0, 23.0, 0.314, -100.0, 0.0, -1.0e5])
+
+
+def _endf_line(data, mat, mf, mt, ns):
+    return f'{data:<66}{mat:4}{mf:2}{mt:3}{ns:5}\n'
+
+
+def _endf_records(mat=125):
+    """Return the records of a minimal material with an MF=1 and MF=3 section"""
+    mf1 = [
+        ' 1.001000+3 9.991673-1          0          0          0          0',
+        ' 0.000000+0 0.000000+0          0          0          0          6',
+        ' 1.000000+0 2.000000+7          1          0         10          8',
+        ' 0.000000+0 0.000000+0          0          0          5          2',
+        '  1-H -  1 LANL       EVAL-JUL16 G.M.Hale',
+        ' DIST-FEB18                       20170222',
+        '----ENDF/B-VIII.0     MATERIAL  125',
+        '-----INCIDENT NEUTRON DATA',
+        '------ENDF-6 FORMAT',
+        '                                1        451          5          0',
+        '                                3          1          4          0',
+    ]
+    lines = [_endf_line(d, mat, 1, 451, i + 1) for i, d in enumerate(mf1)]
+    lines += [_endf_line('', mat, 1, 0, 99999), _endf_line('', mat, 0, 0, 0)]
+    mf3 = [
+        ' 1.001000+3 9.991673-1          0          0          0          0',
+        ' 0.000000+0 0.000000+0          0          0          1          3',
+        '          3          2',
+        ' 1.000000-5 3.000000+1 1.000000+0 2.000000+1 2.000000+7 1.000000+0',
+    ]
+    lines += [_endf_line(d, mat, 3, 1, i + 1) for i, d in enumerate(mf3)]
+    lines += [_endf_line('', mat, 3, 0, 99999), _endf_line('', mat, 0, 0, 0)]
+    lines.append(_endf_line('', 0, 0, 0, 0))
+    return ''.join(lines)
+
+
+def _endf_material(*mats):
+    """Return an ENDF-6 tape containing minimal materials"""
+    return (_endf_line(' Test material', 1, 0, 0, 0) +
+            ''.join(_endf_records(mat) for mat in (mats or (125,))) +
+            _endf_line('', -1, 0, 0, 0))
+
+
+def test_evaluation(tmp_path):
+    path = tmp_path / 'material.endf'
+    path.write_text(_endf_material())
+
+    ev = endf.Evaluation(path)
+    assert ev.material == 125
+    assert set(ev.section) == {(1, 451), (3, 1)}
+    assert ev.target['atomic_number'] == 1
+    assert ev.target['mass_number'] == 1
+    assert ev.reaction_list == [(1, 451, 5, 0), (3, 1, 4, 0)]
+
+    file_obj = io.StringIO(ev.section[3, 1])
+    endf.get_head_record(file_obj)
+    _, xs = endf.get_tab1_record(file_obj)
+    assert xs.x == approx([1e-5, 1.0, 2e7])
+    assert xs.y == approx([30.0, 20.0, 1.0])
+
+    # Reading from an open file should give identical sections
+    with open(path) as fh:
+        ev_fh = endf.Evaluation(fh)
+    assert ev_fh.section == ev.section
+
+    evaluations = endf.get_evaluations(path)
+    assert len(evaluations) == 1
+    assert evaluations[0].section == ev.section
+
+
+def test_evaluation_irregular_records(tmp_path):
+    # Records that aren't exactly 80 columns wide should be read line by line
+    text = _endf_material()
+    path = tmp_path / 'material.endf'
+    path.write_text(text)
+    path_crlf = tmp_path / 'material_crlf.endf'
+    path_crlf.write_bytes(text.replace('\n', '\r\n').encode())
+
+    ev = endf.Evaluation(path)
+    ev_crlf = endf.Evaluation(path_crlf)
+    assert ev_crlf.section == ev.section
+
+
+def test_get_evaluations(tmp_path):
+    path = tmp_path / 'tape.endf'
+    path.write_text(_endf_material(125, 128, 131))
+
+    evaluations = endf.get_evaluations(path)
+    assert [ev.material for ev in evaluations] == [125, 128, 131]
+
+    # Each material should be read the same as it is line by line
+    with open(path) as fh:
+        for ev in evaluations:
+            ev_fh = endf.Evaluation(fh)
+            assert ev_fh.material == ev.material
+            assert ev_fh.section == ev.section
+
+
+def test_evaluation_malformed_mend(tmp_path):
+    # Shift the MF/MT columns of the first MEND record. Only the MAT column
+    # identifies it, so the material should be read line by line rather than
+    # running on into the next material.
+    lines = _endf_material(125, 128).splitlines(keepends=True)
+    i = next(i for i, line in enumerate(lines) if line[66:75] == '   0 0  0')
+    lines[i] = lines[i][:66] + '   0 0 0 ' + lines[i][75:]
+    path = tmp_path / 'tape.endf'
+    path.write_text(''.join(lines))
+
+    ev = endf.Evaluation(path)
+    assert ev.material == 125
+    assert set(ev.section) == {(1, 451), (3, 1)}
+    with open(path) as fh:
+        assert endf.Evaluation(fh).section == ev.section
+
+
+def test_evaluation_invalid_mf(tmp_path):
+    # Errors in the control columns should propagate rather than being masked
+    # by the memory map failing to close
+    lines = _endf_material().splitlines(keepends=True)
+    i = next(i for i, line in enumerate(lines) if line[70:75] == ' 3  1')
+    lines[i] = lines[i][:70] + '  ' + lines[i][72:]
+    path = tmp_path / 'material.endf'
+    path.write_text(''.join(lines))
+
+    with pytest.raises(ValueError):
+        endf.Evaluation(path)